@@ -1,34 +1,59 @@
 import Foundation
 import Supabase
+import os
+
+private let logger = Logger(subsystem: "com.rishabsanjay", category: "Supabase")
 
 class SupabaseService: ObservableObject {
     static let shared = SupabaseService()
     
     let client: SupabaseClient
-    
+
+    // Shared session so the Plaid edge function calls reuse one keep-alive
+    // TLS connection instead of paying a fresh handshake per request
+    private let urlSession: URLSession
+
+    // ISO8601DateFormatter is expensive to create, so share one instance
+    // instead of allocating a new formatter for every row we convert
+    private let dateFormatter = ISO8601DateFormatter()
+
     private init() {
         self.client = SupabaseClient(
             supabaseURL: URL(string: SupabaseConfig.url)!,
             supabaseKey: SupabaseConfig.anonKey
         )
+
+        let configuration = URLSessionConfiguration.default
+        configuration.httpMaximumConnectionsPerHost = 4
+        configuration.httpShouldUsePipelining = true
+        // Bound how long a wedged edge call can hang the link flow
+        configuration.timeoutIntervalForRequest = 30
+        configuration.timeoutIntervalForResource = 60
+        self.urlSession = URLSession(configuration: configuration)
     }
     
     // MARK: - Plaid Integration Functions
-    
-    func createLinkToken() async throws -> String {
-        guard let url = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/create-link-token") else {
-            throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid URL"])
-        }
 
-        var request = URLRequest(url: url)
+    // Endpoint URLs never change, so parse them once at load instead of
+    // re-parsing the string on every call
+    private static let createLinkTokenURL = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/create-link-token")!
+    private static let exchangeTokenURL = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/exchange-token")!
+    private static let getTransactionsURL = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/get-transactions")!
+
+    // create-link-token always posts the same empty JSON body, so
+    // encode it once instead of per request
+    private static let emptyJSONBody = Data("{}".utf8)
+
+    func createLinkToken() async throws -> String {
+        var request = URLRequest(url: Self.createLinkTokenURL)
         request.httpMethod = "POST"
         request.setValue("application/json", forHTTPHeaderField: "Content-Type")
         request.setValue("Bearer \(SupabaseConfig.anonKey)", forHTTPHeaderField: "Authorization")
         
         // Empty body for POST request
-        request.httpBody = "{}".data(using: .utf8)
+        request.httpBody = Self.emptyJSONBody
 
-        let (data, response) = try await URLSession.shared.data(for: request)
+        let (data, response) = try await urlSession.data(for: request)
 
         guard let httpResponse = response as? HTTPURLResponse else {
             throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid response"])
@@ -48,11 +73,7 @@ class SupabaseService: ObservableObject {
     }
     
     func exchangeToken(publicToken: String) async throws -> String {
-        guard let url = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/exchange-token") else {
-            throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid URL"])
-        }
-
-        var request = URLRequest(url: url)
+        var request = URLRequest(url: Self.exchangeTokenURL)
         request.httpMethod = "POST"
         request.setValue("application/json", forHTTPHeaderField: "Content-Type")
         request.setValue("Bearer \(SupabaseConfig.anonKey)", forHTTPHeaderField: "Authorization")
@@ -60,7 +81,7 @@ class SupabaseService: ObservableObject {
         let requestBody = ["public_token": publicToken]
         request.httpBody = try JSONSerialization.data(withJSONObject: requestBody)
 
-        let (data, response) = try await URLSession.shared.data(for: request)
+        let (data, response) = try await urlSession.data(for: request)
 
         guard let httpResponse = response as? HTTPURLResponse else {
             throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid response"])
@@ -80,11 +101,7 @@ class SupabaseService: ObservableObject {
     }
     
     func getTransactions(accessToken: String) async throws -> [[String: Any]] {
-        guard let url = URL(string: "https://qmxyiqjwpgxucwhyckzg.functions.supabase.co/get-transactions") else {
-            throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid URL"])
-        }
-
-        var request = URLRequest(url: url)
+        var request = URLRequest(url: Self.getTransactionsURL)
         request.httpMethod = "POST"
         request.setValue("application/json", forHTTPHeaderField: "Content-Type")
         request.setValue("Bearer \(SupabaseConfig.anonKey)", forHTTPHeaderField: "Authorization")
@@ -92,7 +109,7 @@ class SupabaseService: ObservableObject {
         let requestBody = ["access_token": accessToken]
         request.httpBody = try JSONSerialization.data(withJSONObject: requestBody)
 
-        let (data, response) = try await URLSession.shared.data(for: request)
+        let (data, response) = try await urlSession.data(for: request)
 
         guard let httpResponse = response as? HTTPURLResponse else {
             throw NSError(domain: "SupabaseError", code: -1, userInfo: [NSLocalizedDescriptionKey: "Invalid response"])
@@ -132,12 +149,12 @@ class SupabaseService: ObservableObject {
         let transactionData = TransactionData(
             id: transaction.id,
             user_id: userId.uuidString,
-            date: ISO8601DateFormatter().string(from: transaction.date),
+            date: dateFormatter.string(from: transaction.date),
             description: transaction.description,
             amount: transaction.amount,
             category: transaction.category.rawValue,
             type: transaction.type.rawValue,
-            created_at: ISO8601DateFormatter().string(from: Date())
+            created_at: dateFormatter.string(from: Date())
         )
         
         try await client.database
@@ -157,15 +174,16 @@ class SupabaseService: ObservableObject {
             let created_at: String
         }
         
+        let createdAt = dateFormatter.string(from: Date())
         let transactionsData = transactions.map { transaction in
             TransactionData(
                 id: transaction.id,
-                date: ISO8601DateFormatter().string(from: transaction.date),
+                date: dateFormatter.string(from: transaction.date),
                 description: transaction.description,
                 amount: transaction.amount,
                 category: transaction.category.rawValue,
                 type: transaction.type.rawValue,
-                created_at: ISO8601DateFormatter().string(from: Date())
+                created_at: createdAt
             )
         }
         
@@ -198,19 +216,16 @@ class SupabaseService: ObservableObject {
             .execute()
             .value
         
-        var transactions: [Transaction] = []
-        
-        for supabaseTransaction in response {
+        return response.compactMap { supabaseTransaction in
             guard let category = TransactionCategory(rawValue: supabaseTransaction.category),
                   let type = TransactionType(rawValue: supabaseTransaction.type) else {
-                print("Failed to parse transaction: \(supabaseTransaction)")
-                continue
+                logger.error("Failed to parse transaction \(supabaseTransaction.id)")
+                return nil
             }
-            
-            let formatter = ISO8601DateFormatter()
-            let date = formatter.date(from: supabaseTransaction.date) ?? Date()
-            
-            let transaction = Transaction(
+
+            let date = dateFormatter.date(from: supabaseTransaction.date) ?? Date()
+
+            return Transaction(
                 id: supabaseTransaction.id,
                 date: date,
                 description: supabaseTransaction.description,
@@ -218,11 +233,7 @@ class SupabaseService: ObservableObject {
                 category: category,
                 type: type
             )
-            
-            transactions.append(transaction)
         }
-        
-        return transactions
     }
     
     func updateTransactionCategory(transactionId: String, category: TransactionCategory) async throws {
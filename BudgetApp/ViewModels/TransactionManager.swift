@@ -1,6 +1,9 @@
 import Foundation
 import SwiftUI
 import CoreXLSX
+import os
+
+private let logger = Logger(subsystem: "com.rishabsanjay", category: "Transactions")
 
 class TransactionManager: ObservableObject {
     @Published var transactions: [Transaction] = []
@@ -21,7 +24,7 @@ class TransactionManager: ObservableObject {
             do {
                 try await supabaseService.saveTransaction(transaction)
             } catch {
-                print("Failed to save transaction to Supabase: \(error)")
+                logger.error("Failed to save transaction to Supabase: \(String(describing: error))")
                 DispatchQueue.main.async {
                     self.errorMessage = "Failed to save transaction: \(error.localizedDescription)"
                     self.showError = true
@@ -58,6 +61,14 @@ class TransactionManager: ObservableObject {
         return (total: total, categorized: categorized, accuracy: accuracy)
     }
     
+    // Built once at load; supporting a new format is a table entry
+    // rather than another chained branch. The values are unbound method
+    // references, applied to the importing instance at lookup time.
+    private static let importers: [String: (TransactionManager) -> (URL) throws -> [Transaction]] = [
+        "csv": TransactionManager.importCSV(from:),
+        "xlsx": TransactionManager.importXLSX(from:)
+    ]
+
     func importFile(url: URL) {
         guard url.startAccessingSecurityScopedResource() else {
             errorMessage = "Unable to access file"
@@ -70,23 +81,37 @@ class TransactionManager: ObservableObject {
         }
         
         do {
-            let pathExtension = url.pathExtension.lowercased()
-            var importedTransactions: [Transaction] = []
-            
-            if pathExtension == "csv" {
-                importedTransactions = try importCSV(from: url)
-            } else if pathExtension == "xlsx" {
-                importedTransactions = try importXLSX(from: url)
-            } else {
+            guard let importer = Self.importers[url.pathExtension.lowercased()] else {
                 throw ImportError.unsupportedFormat
             }
-            
+
+            let importedTransactions = try importer(self)(url)
+
+            // Test each imported row against a set of existing
+            // (date, description, cents) keys instead of rescanning the
+            // whole transaction list per row. Amounts are quantized to
+            // whole cents for the key; rows one cent apart stay
+            // distinct, matching the old abs(difference) < 0.01 check.
+            struct DedupKey: Hashable {
+                let date: Date
+                let description: String
+                let cents: Int
+            }
+
+            let existingKeys = Set(transactions.map { transaction in
+                DedupKey(
+                    date: transaction.date,
+                    description: transaction.description,
+                    cents: Int((transaction.amount * 100).rounded())
+                )
+            })
+
             let newTransactions = importedTransactions.filter { importedTransaction in
-                !transactions.contains { existingTransaction in
-                    existingTransaction.date == importedTransaction.date &&
-                    existingTransaction.description == importedTransaction.description &&
-                    abs(existingTransaction.amount - importedTransaction.amount) < 0.01
-                }
+                !existingKeys.contains(DedupKey(
+                    date: importedTransaction.date,
+                    description: importedTransaction.description,
+                    cents: Int((importedTransaction.amount * 100).rounded())
+                ))
             }
             
             if newTransactions.isEmpty {
@@ -105,7 +130,7 @@ class TransactionManager: ObservableObject {
                 do {
                     try await supabaseService.saveTransactions(newTransactions)
                 } catch {
-                    print("Failed to save imported transactions to Supabase: \(error)")
+                    logger.error("Failed to save imported transactions to Supabase: \(String(describing: error))")
                     DispatchQueue.main.async {
                         self.errorMessage = "Transactions imported locally but failed to sync with cloud: \(error.localizedDescription)"
                         self.showError = true
@@ -125,8 +150,10 @@ class TransactionManager: ObservableObject {
     
     private func importCSV(from url: URL) throws -> [Transaction] {
         let content = try String(contentsOf: url)
-        let lines = content.components(separatedBy: .newlines)
-        
+        // Split into substring views of the loaded contents instead of
+        // materializing a second full copy of the file as separate strings
+        let lines = content.split(omittingEmptySubsequences: false, whereSeparator: \.isNewline)
+
         guard lines.count > 0 else {
             throw ImportError.invalidFormat
         }
@@ -160,7 +187,7 @@ class TransactionManager: ObservableObject {
         } else {
             let sampleLines = lines.prefix(5).filter { !$0.trimmingCharacters(in: .whitespacesAndNewlines).isEmpty }
             
-            if let detectedColumns = detectColumnsFromData(sampleLines.map { $0 }) {
+            if let detectedColumns = detectColumnsFromData(sampleLines.map { String($0) }) {
                 dateColumnIndex = detectedColumns.dateIndex
                 descriptionColumnIndex = detectedColumns.descriptionIndex
                 amountColumnIndex = detectedColumns.amountIndex
@@ -169,7 +196,7 @@ class TransactionManager: ObservableObject {
         
         if dateColumnIndex == -1 || descriptionColumnIndex == -1 || amountColumnIndex == -1 {
             let firstDataLine = lines[startIndex < lines.count ? startIndex : 0]
-            let columns = parseCSVLine(firstDataLine)
+            let columns = parseCSVLine(String(firstDataLine))
             
             if columns.count >= 3 {
                 for (index, column) in columns.enumerated() {
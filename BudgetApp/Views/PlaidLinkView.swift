@@ -1,5 +1,8 @@
 import SwiftUI
 import LinkKit
+import os
+
+private let logger = Logger(subsystem: "com.rishabsanjay", category: "Plaid")
 
 struct PlaidLinkView: UIViewControllerRepresentable {
     let linkToken: String
@@ -30,23 +33,23 @@ class PlaidLinkViewController: UIViewController {
     
     private func createHandler() {
         var linkConfiguration = LinkTokenConfiguration(token: linkToken) { [weak self] success in
-            print("public-token: \(success.publicToken) metadata: \(success.metadata)")
+            logger.debug("Plaid Link succeeded")
             self?.onSuccess(success.publicToken)
         }
-        
+
         linkConfiguration.onExit = { [weak self] exit in
             if let error = exit.error {
-                print("exit with error \(error)\n\(exit.metadata)")
+                logger.error("Plaid Link exited with error: \(String(describing: error))")
             } else {
-                print("exit with \(exit.metadata)")
+                logger.info("Plaid Link exited")
             }
             self?.onExit()
         }
-        
+
         let result = Plaid.create(linkConfiguration)
         switch result {
         case .failure(let error):
-            print("Unable to create Plaid handler: \(error)")
+            logger.error("Unable to create Plaid handler: \(String(describing: error))")
         case .success(let handler):
             self.handler = handler
             DispatchQueue.main.async {
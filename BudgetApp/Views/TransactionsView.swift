@@ -1,6 +1,9 @@
 import SwiftUI
 import UniformTypeIdentifiers
 import LinkKit
+import os
+
+private let logger = Logger(subsystem: "com.rishabsanjay", category: "Plaid")
 
 struct TransactionsView: View {
     @ObservedObject var transactionManager: TransactionManager
@@ -104,7 +107,7 @@ struct TransactionsView: View {
                 PlaidLinkView(
                     linkToken: token,
                     onSuccess: { publicToken in
-                        print("Got public token: \(publicToken)")
+                        logger.debug("Got public token")
                         showingPlaidLink = false
                         isLoadingPlaidData = true
                         plaidStatusMessage = "Connecting to your bank..."
@@ -112,7 +115,7 @@ struct TransactionsView: View {
                             do {
                                 try await fetchTransactionsFromPlaid(publicToken: publicToken)
                             } catch {
-                                print("Error fetching transactions: \(error)")
+                                logger.error("Error fetching transactions: \(String(describing: error))")
                                 await MainActor.run {
                                     isLoadingPlaidData = false
                                     plaidStatusMessage = ""
@@ -314,7 +317,7 @@ struct TransactionsView: View {
                                             category: category
                                         )
                                     } catch {
-                                        print("Failed to update category in Supabase: \(error)")
+                                        logger.error("Failed to update category in Supabase: \(String(describing: error))")
                                     }
                                 }
                             }
@@ -377,7 +380,7 @@ struct TransactionsView: View {
                 transactionManager.transactions = transactions
             }
         } catch {
-            print("Failed to load transactions from Supabase: \(error)")
+            logger.error("Failed to load transactions from Supabase: \(String(describing: error))")
             await MainActor.run {
                 transactionManager.errorMessage = "Failed to load transactions: \(error.localizedDescription)"
                 transactionManager.showError = true
@@ -386,7 +389,7 @@ struct TransactionsView: View {
     }
     
     private func fetchTransactionsFromPlaid(publicToken: String) async throws {
-        print("💳 Starting transaction fetch with public token: \(String(publicToken.prefix(20)))...")
+        logger.info("Starting transaction fetch with public token")
         
         await MainActor.run {
             plaidStatusMessage = "Exchanging tokens..."
@@ -394,7 +397,7 @@ struct TransactionsView: View {
         
         // Exchange public token for access token using Supabase
         let accessToken = try await supabaseService.exchangeToken(publicToken: publicToken)
-        print("💳 Successfully received access token: \(String(accessToken.prefix(20)))...")
+        logger.info("Successfully received access token")
         
         await MainActor.run {
             plaidStatusMessage = "Fetching your transactions..."
@@ -402,24 +405,27 @@ struct TransactionsView: View {
         
         // Get transactions using Supabase
         let plaidTransactions = try await supabaseService.getTransactions(accessToken: accessToken)
-        print("💳 Parsed \(plaidTransactions.count) transactions from response")
+        logger.info("Parsed \(plaidTransactions.count) transactions from response")
         
         if plaidTransactions.isEmpty {
-            print("💳 No transactions found in response")
+            logger.info("No transactions found in response")
         }
         
+        // Plaid dates are always "yyyy-MM-dd" strings, so one formatter
+        // serves every row instead of allocating one per transaction
+        let dateFormatter = DateFormatter()
+        dateFormatter.dateFormat = "yyyy-MM-dd"
+
         let appTransactions = plaidTransactions.compactMap { dict -> Transaction? in
             guard let dateStr = dict["date"] as? String,
                   let amount = dict["amount"] as? Double,
                   let name = dict["name"] as? String,
                   let _ = dict["transaction_id"] as? String
             else {
-                print("💳 Skipping transaction due to missing fields: \(dict)")
+                logger.debug("Skipping transaction due to missing fields")
                 return nil
             }
-            
-            let dateFormatter = DateFormatter()
-            dateFormatter.dateFormat = "yyyy-MM-dd"
+
             let transactionDate = dateFormatter.date(from: dateStr) ?? Date()
             
             let predictedCategory = Transaction.predictCategory(from: name)
@@ -433,7 +439,7 @@ struct TransactionsView: View {
             )
         }
         
-        print("💳 Successfully converted \(appTransactions.count) transactions to app format")
+        logger.info("Converted \(appTransactions.count) transactions to app format")
         
         // Save transactions to Supabase
         if !appTransactions.isEmpty {
@@ -452,7 +458,7 @@ struct TransactionsView: View {
             } else {
                 plaidStatusMessage = "✅ Successfully loaded \(appTransactions.count) transactions!"
                 transactionManager.transactions.append(contentsOf: appTransactions)
-                print("💳 Added \(appTransactions.count) transactions to transaction manager")
+                logger.info("Added \(appTransactions.count) transactions to transaction manager")
             }
             
             DispatchQueue.main.asyncAfter(deadline: .now() + 2.0) {
@@ -470,10 +476,10 @@ struct TransactionsView: View {
         }
         
         do {
-            print("🔗 Starting link token generation...")
+            logger.info("Starting link token generation")
             
             let token = try await supabaseService.createLinkToken()
-            print("🔗 Successfully received link token: \(String(token.prefix(20)))...")
+            logger.info("Successfully received link token")
             
             await MainActor.run {
                 self.linkToken = token
@@ -482,7 +488,7 @@ struct TransactionsView: View {
             }
             
         } catch {
-            print("🔗 Error generating link token: \(error)")
+            logger.error("Error generating link token: \(String(describing: error))")
             await MainActor.run {
                 isLoadingLinkToken = false
                 
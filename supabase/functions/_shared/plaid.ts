@@ -0,0 +1,49 @@
+import { Configuration, PlaidApi, PlaidEnvironments } from "npm:plaid@14.0.0"
+
+const PLAID_CLIENT_ID = Deno.env.get('PLAID_CLIENT_ID')
+const PLAID_SECRET = Deno.env.get('PLAID_SECRET')
+const PLAID_ENV = Deno.env.get('PLAID_ENV') || 'sandbox'
+
+if (!PLAID_CLIENT_ID || !PLAID_SECRET) {
+  throw new Error('Missing required environment variables: PLAID_CLIENT_ID, PLAID_SECRET')
+}
+
+const configuration = new Configuration({
+  basePath: PlaidEnvironments[PLAID_ENV as keyof typeof PlaidEnvironments],
+  baseOptions: {
+    // Fail fast instead of letting a Plaid slowdown wedge the function
+    timeout: 15000,
+    headers: {
+      'PLAID-CLIENT-ID': PLAID_CLIENT_ID,
+      'PLAID-SECRET': PLAID_SECRET,
+    },
+  },
+})
+
+export const client = new PlaidApi(configuration)
+
+// Every response carries the same JSON + CORS headers, so build the
+// object once at module scope instead of re-creating it per response
+export const responseHeaders = {
+  'Content-Type': 'application/json',
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Methods': 'POST',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+}
+
+export function jsonResponse(payload: unknown, status = 200): Response {
+  return new Response(JSON.stringify(payload), { status, headers: responseHeaders })
+}
+
+// One bounded retry on a timeout or 5xx for transient Plaid blips.
+// Only wrap calls that are safe to repeat (reads and token minting,
+// never the one-shot public token exchange).
+export async function withRetry<T>(call: () => Promise<T>): Promise<T> {
+  try {
+    return await call()
+  } catch (error) {
+    const status = error?.response?.status
+    if (status && status < 500) throw error
+    return await call()
+  }
+}
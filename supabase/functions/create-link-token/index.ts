@@ -1,76 +1,69 @@
 import "jsr:@supabase/functions-js/edge-runtime.d.ts"
-import { Configuration, PlaidApi, PlaidEnvironments } from "npm:plaid@14.0.0"
+import { client, jsonResponse, withRetry } from "../_shared/plaid.ts"
 
-const PLAID_CLIENT_ID = Deno.env.get('PLAID_CLIENT_ID')
-const PLAID_SECRET = Deno.env.get('PLAID_SECRET')
-const PLAID_ENV = Deno.env.get('PLAID_ENV') || 'sandbox'
-
-if (!PLAID_CLIENT_ID || !PLAID_SECRET) {
-  throw new Error('Missing required environment variables: PLAID_CLIENT_ID, PLAID_SECRET')
+// A link token is single-use: the first Link session that completes
+// with it invalidates it for every other holder, so replaying one for
+// its multi-hour lifetime would hand consumed tokens to other users.
+// Only reuse the last minted token inside a seconds-scale window, which
+// absorbs duplicate requests from the same tap or client retry.
+const DUPLICATE_WINDOW_MS = 5_000
+const linkTokenCache = {
+  token: null as string | null,
+  expiration: null as string | null,
+  mintedAt: 0,
 }
 
-const configuration = new Configuration({
-  basePath: PlaidEnvironments[PLAID_ENV as keyof typeof PlaidEnvironments],
-  baseOptions: {
-    headers: {
-      'PLAID-CLIENT-ID': PLAID_CLIENT_ID,
-      'PLAID-SECRET': PLAID_SECRET,
-    },
-  },
-})
-
-const client = new PlaidApi(configuration)
+// Everything in the link token request except the user id is constant,
+// so build the template once and splice the fresh id in per call
+const linkTokenRequest = {
+  client_name: 'BudgetApp',
+  products: ['transactions'],
+  country_codes: ['US'],
+  language: 'en',
+  redirect_uri: undefined,
+  android_package_name: undefined,
+  webhook: undefined,
+}
 
 Deno.serve(async (req) => {
   try {
+    if (
+      linkTokenCache.token &&
+      Date.now() - linkTokenCache.mintedAt < DUPLICATE_WINDOW_MS
+    ) {
+      console.log('Returning cached link token')
+
+      return jsonResponse({
+        link_token: linkTokenCache.token,
+        expiration: linkTokenCache.expiration,
+      })
+    }
+
     console.log('Creating link token for Plaid...')
-    
-    const response = await client.linkTokenCreate({
+
+    const response = await withRetry(() => client.linkTokenCreate({
+      ...linkTokenRequest,
       user: {
         client_user_id: 'user_' + Date.now().toString(),
       },
-      client_name: 'BudgetApp',
-      products: ['transactions'],
-      country_codes: ['US'],
-      language: 'en',
-      redirect_uri: undefined,
-      android_package_name: undefined,
-      webhook: undefined,
-    })
+    }))
 
     console.log('Link token created successfully')
-    
-    return new Response(
-      JSON.stringify({
-        link_token: response.data.link_token,
-        expiration: response.data.expiration,
-      }),
-      {
-        headers: {
-          'Content-Type': 'application/json',
-          'Access-Control-Allow-Origin': '*',
-          'Access-Control-Allow-Methods': 'POST',
-          'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
-        },
-      }
-    )
+
+    linkTokenCache.token = response.data.link_token
+    linkTokenCache.expiration = response.data.expiration
+    linkTokenCache.mintedAt = Date.now()
+
+    return jsonResponse({
+      link_token: response.data.link_token,
+      expiration: response.data.expiration,
+    })
   } catch (error) {
     console.error('Error creating link token:', error)
-    
-    return new Response(
-      JSON.stringify({
-        error: 'Failed to create link token',
-        details: error.message,
-      }),
-      {
-        status: 500,
-        headers: {
-          'Content-Type': 'application/json',
-          'Access-Control-Allow-Origin': '*',
-          'Access-Control-Allow-Methods': 'POST',
-          'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
-        },
-      }
-    )
+
+    return jsonResponse({
+      error: 'Failed to create link token',
+      details: error.message,
+    }, 500)
   }
-})
\ No newline at end of file
+})
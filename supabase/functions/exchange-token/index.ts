@@ -1,86 +1,62 @@
 import "jsr:@supabase/functions-js/edge-runtime.d.ts"
-import { Configuration, PlaidApi, PlaidEnvironments } from "npm:plaid@14.0.0"
+import { client, jsonResponse } from "../_shared/plaid.ts"
 
-const PLAID_CLIENT_ID = Deno.env.get('PLAID_CLIENT_ID')
-const PLAID_SECRET = Deno.env.get('PLAID_SECRET')
-const PLAID_ENV = Deno.env.get('PLAID_ENV') || 'sandbox'
-
-if (!PLAID_CLIENT_ID || !PLAID_SECRET) {
-  throw new Error('Missing required environment variables: PLAID_CLIENT_ID, PLAID_SECRET')
-}
-
-const configuration = new Configuration({
-  basePath: PlaidEnvironments[PLAID_ENV as keyof typeof PlaidEnvironments],
-  baseOptions: {
-    headers: {
-      'PLAID-CLIENT-ID': PLAID_CLIENT_ID,
-      'PLAID-SECRET': PLAID_SECRET,
-    },
-  },
-})
-
-const client = new PlaidApi(configuration)
+// Mobile clients retry on flaky networks and may resend the same
+// public_token; Plaid only allows one exchange per token, so remember
+// recent results for a short window and replay them instead of failing
+// the duplicate call with another Plaid round-trip
+const EXCHANGE_TTL_MS = 300_000
+const EXCHANGE_CACHE_MAX = 2048
+const exchangeCache = new Map<string, { access_token: string; item_id: string; mintedAt: number }>()
 
 Deno.serve(async (req) => {
   try {
     const { public_token } = await req.json()
-    
+
     if (!public_token) {
-      return new Response(
-        JSON.stringify({
-          error: 'Missing public_token in request body',
-        }),
-        {
-          status: 400,
-          headers: {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'POST',
-            'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
-          },
-        }
-      )
+      return jsonResponse({
+        error: 'Missing public_token in request body',
+      }, 400)
     }
-    
+
+    const cached = exchangeCache.get(public_token)
+    if (cached && Date.now() - cached.mintedAt < EXCHANGE_TTL_MS) {
+      console.log('Returning cached token exchange result')
+
+      return jsonResponse({
+        access_token: cached.access_token,
+        item_id: cached.item_id,
+      })
+    }
+
     console.log('Exchanging public token for access token...')
-    
+
     const response = await client.itemPublicTokenExchange({
       public_token,
     })
 
     console.log('Token exchange successful')
-    
-    return new Response(
-      JSON.stringify({
-        access_token: response.data.access_token,
-        item_id: response.data.item_id,
-      }),
-      {
-        headers: {
-          'Content-Type': 'application/json',
-          'Access-Control-Allow-Origin': '*',
-          'Access-Control-Allow-Methods': 'POST',
-          'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
-        },
-      }
-    )
+
+    if (exchangeCache.size >= EXCHANGE_CACHE_MAX) {
+      const oldest = exchangeCache.keys().next().value
+      if (oldest !== undefined) exchangeCache.delete(oldest)
+    }
+    exchangeCache.set(public_token, {
+      access_token: response.data.access_token,
+      item_id: response.data.item_id,
+      mintedAt: Date.now(),
+    })
+
+    return jsonResponse({
+      access_token: response.data.access_token,
+      item_id: response.data.item_id,
+    })
   } catch (error) {
     console.error('Error exchanging token:', error)
-    
-    return new Response(
-      JSON.stringify({
-        error: 'Failed to exchange token',
-        details: error.message,
-      }),
-      {
-        status: 500,
-        headers: {
-          'Content-Type': 'application/json',
-          'Access-Control-Allow-Origin': '*',
-          'Access-Control-Allow-Methods': 'POST',
-          'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
-        },
-      }
-    )
+
+    return jsonResponse({
+      error: 'Failed to exchange token',
+      details: error.message,
+    }, 500)
   }
-})
\ No newline at end of file
+})